@@ -0,0 +1,188 @@
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linprog
+from typing import Dict, Any, List, Tuple
+
+import tools
+from logger import logger
+
+# FLEET CONFIGURATION
+
+# Economic Parameters for the joint dispatch
+SHED_COST_PER_MW = 1000.0    # Unserved load is far worse than burning gas
+TRANSFER_COST_PER_MW = 0.01  # Small wheeling cost, avoids pointless trades
+
+# Variable layout per grid inside the LP vector
+SOURCES = ("solar", "wind", "gas", "shed")
+
+# FLEET COORDINATOR
+class FleetCoordinator:
+    """
+    Solves one joint dispatch LP for many interconnected grids every hour.
+
+    All grids burn gas from a single shared pool and can trade power over
+    links with a transfer limit. Each grid keeps its own state dict (same
+    keys as tools.WORLD_STATE) so the regular tools can be reused per grid.
+    """
+
+    def __init__(self, grids: Dict[str, Dict[str, Any]], links: List[Tuple[str, str, float]], gas_pool_mw: float):
+        """
+        Args:
+            grids: Grid name -> grid state (current_hour, weather_condition, grid_load_base).
+            links: (grid_a, grid_b, limit_mw) transfer lines between grids.
+            gas_pool_mw: Gas reserve shared by the whole fleet.
+        """
+        self.names = list(grids)
+        self.grids = grids
+        self.links = links
+        self.gas_pool_mw = gas_pool_mw
+
+        # The network topology does not change between hours, so the sparse
+        # model is assembled once and every hourly solve only refreshes bounds.
+        self._build_model()
+
+    def _build_model(self):
+        """
+        Assembles the constant parts of the LP: cost vector and sparse constraint matrices.
+        """
+        n_grids = len(self.names)
+        n_links = len(self.links)
+        n_gen = n_grids * len(SOURCES)
+        index = {name: i for i, name in enumerate(self.names)}
+
+        link_from = np.array([index[a] for a, _, _ in self.links], dtype=int)
+        link_to = np.array([index[b] for _, b, _ in self.links], dtype=int)
+        self.link_limits = np.array([limit for _, _, limit in self.links], dtype=float)
+
+        # Variables: [solar, wind, gas, shed] per grid, then forward and backward flow per link
+        self.n_vars = n_gen + 2 * n_links
+
+        cost = np.zeros((n_grids, len(SOURCES)))
+        cost[:, SOURCES.index("gas")] = tools.GAS_COST_PER_MW
+        cost[:, SOURCES.index("shed")] = SHED_COST_PER_MW
+        self.cost = np.concatenate([cost.ravel(), np.full(2 * n_links, TRANSFER_COST_PER_MW)])
+
+        # Power balance per grid: local supply + shed + imports - exports = demand
+        fwd = n_gen + np.arange(n_links)
+        bwd = fwd + n_links
+        rows = np.concatenate([
+            np.repeat(np.arange(n_grids), len(SOURCES)),
+            link_from, link_to,  # forward flow leaves 'from', arrives at 'to'
+            link_to, link_from,  # backward flow leaves 'to', arrives at 'from'
+        ])
+        cols = np.concatenate([np.arange(n_gen), fwd, fwd, bwd, bwd])
+        vals = np.concatenate([
+            np.ones(n_gen),
+            -np.ones(n_links), np.ones(n_links),
+            -np.ones(n_links), np.ones(n_links),
+        ])
+        self.A_eq = sparse.csr_matrix((vals, (rows, cols)), shape=(n_grids, self.n_vars))
+
+        # Shared gas pool: total gas burned by the fleet <= pool
+        gas_cols = np.arange(n_grids) * len(SOURCES) + SOURCES.index("gas")
+        self.A_ub = sparse.csr_matrix(
+            (np.ones(n_grids), (np.zeros(n_grids, dtype=int), gas_cols)), shape=(1, self.n_vars)
+        )
+
+        # Net import per grid is read straight off the flow part of the balance matrix
+        self.import_matrix = self.A_eq[:, n_gen:]
+
+    def _grid_view(self, name: str) -> Dict[str, Any]:
+        """
+        Returns the grid state with the shared gas pool exposed as its reserve.
+        """
+        state = self.grids[name]
+        state["gas_reserve_mw"] = self.gas_pool_mw
+        return state
+
+    def plan_hour(self) -> Dict[str, Dict[str, float]]:
+        """
+        Forecasts every grid, solves the joint LP and returns one allocation per grid.
+
+        Returns:
+            dict: Grid name -> distribution (solar, wind, gas, import) plus planned shed.
+        """
+        demand = np.empty(len(self.names))
+        upper = np.empty((len(self.names), len(SOURCES)))
+
+        for i, name in enumerate(self.names):
+            state = self._grid_view(name)
+            # Offset 0: dispatch_energy_plan is evaluated against the current hour
+            demand[i] = tools.forecast_energy_demand(0, state)
+            caps = tools.check_generation_capacity(state)
+            upper[i] = (caps["solar"], caps["wind"], caps["gas"], demand[i])
+
+        bounds = np.zeros((self.n_vars, 2))
+        bounds[:, 1] = np.concatenate([upper.ravel(), self.link_limits, self.link_limits])
+
+        res = linprog(
+            self.cost,
+            A_ub=self.A_ub, b_ub=[self.gas_pool_mw],
+            A_eq=self.A_eq, b_eq=demand,
+            bounds=bounds,
+            method="highs",
+        )
+        if not res.success:
+            raise RuntimeError(f"Fleet dispatch LP failed: {res.message}")
+
+        gen = res.x[:upper.size].reshape(upper.shape)
+        imports = self.import_matrix @ res.x[upper.size:]
+
+        allocations = {}
+        for i, name in enumerate(self.names):
+            plan = {src: float(gen[i, j]) for j, src in enumerate(SOURCES)}
+            shed = plan.pop("shed")
+            plan["import"] = float(imports[i])
+            allocations[name] = {"distribution": plan, "shed": shed}
+        return allocations
+
+    def dispatch_hour(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Plans the hour and applies each grid's allocation through the regular dispatch tool.
+
+        Returns:
+            dict: Grid name -> grid metrics from dispatch_energy_plan.
+        """
+        allocations = self.plan_hour()
+        results = {}
+
+        for name, alloc in allocations.items():
+            shown = {src: round(mw, 2) for src, mw in alloc["distribution"].items()}
+            logger.log("FLEET PLAN", f"{name}: {shown} (shed {round(alloc['shed'], 2)} MW)")
+            state = self._grid_view(name)
+            # Guard against solver tolerance pushing the last grid past the pool
+            alloc["distribution"]["gas"] = min(alloc["distribution"]["gas"], self.gas_pool_mw)
+            res = tools.dispatch_energy_plan(alloc["distribution"], state)
+            # The grid burned gas from the shared pool
+            self.gas_pool_mw = state["gas_reserve_mw"]
+            results[name] = res
+            logger.log("OBSERVATION", f"{name} Grid Metrics: {res}")
+
+        logger.log("FLEET", f"Shared gas pool remaining: {round(self.gas_pool_mw, 2)} MW")
+        return results
+
+    def run(self, hours: int = 6):
+        """
+        THE FLEET LOOP: one joint solve per hour instead of one LLM plan per grid.
+        """
+        logger.log("SYSTEM", f"--- FLEET EXECUTION STARTED ({len(self.names)} grids) ---")
+        for hour in range(hours):
+            print(f"\n--- HOUR {hour} ---")
+            self.dispatch_hour()
+        logger.log("SYSTEM", f"--- FLEET EXECUTION TERMINATED after {hours} hours ---")
+
+def build_demo_fleet() -> FleetCoordinator:
+    """
+    Three feeders on a ring: a stormy one with surplus wind, a sunny one and a cloudy evening-peak one.
+    """
+    grids = {
+        "north": {"current_hour": 17, "weather_condition": "stormy", "grid_load_base": 120.0},
+        "central": {"current_hour": 17, "weather_condition": "sunny", "grid_load_base": 150.0},
+        "south": {"current_hour": 17, "weather_condition": "cloudy", "grid_load_base": 180.0},
+    }
+    links = [
+        ("north", "central", 60.0),
+        ("central", "south", 60.0),
+        ("south", "north", 40.0),
+    ]
+    return FleetCoordinator(grids, links, gas_pool_mw=3000.0)
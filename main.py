@@ -1,6 +1,7 @@
 import os
 import sys
 import tools
+import fleet
 from agent import EnergyGridAgent
 from logger import logger
 
@@ -25,15 +26,28 @@ def main():
   print("3. Stormy Weather (High Wind, No Solar)")
   print("4. Gas Depletion (Critical - Requires Load Shedding)")
   print("5. Peak Demand (Evening High Load)")
+  print("6. Fleet Coordination (Interconnected Grids, Shared Gas Pool)")
 
   try:
-    choice = input("Select a scenario (1-5) [Default: 1]: ").strip()
+    choice = input("Select a scenario (1-6) [Default: 1]: ").strip()
     scenario_id = int(choice) if choice else 1
   except ValueError:
     print("Invalid input. Defaulting to Scenario 1.")
     scenario_id = 1
   
   print(f"\n Setting up Scenario {scenario_id}...")
+
+  # Fleet mode: one joint LP solve per hour, no LLM planning calls
+  if scenario_id == 6:
+    logger.setup(scenario_id)
+    try:
+      fleet.build_demo_fleet().run()
+    except Exception as e:
+      logger.log("CRITICAL ERROR", str(e))
+    finally:
+      logger.close()
+    return
+
   tools.set_scenario(scenario_id)
   logger.setup(scenario_id)
 
@@ -33,16 +33,18 @@ def set_scenario(scenario_id: int):
         WORLD_STATE.update({"current_hour": 19, "weather_condition": "cloudy", "gas_reserve_mw": 500.0})
 
 # AGENT TOOLS
-def forecast_energy_demand(hour_offset: int) -> float:
+def forecast_energy_demand(hour_offset: int, state: Dict[str, Any] = None) -> float:
     """
     Predicts the expected energy demand (MW) for a future time offset.
     
     Args:
         hour_offset: Hours from the current time.
+        state: Grid state to read from (defaults to WORLD_STATE).
     Returns:
         float: Expected demand in Megawatts.
     """
-    target_hour = (WORLD_STATE["current_hour"] + hour_offset) % 24
+    state = WORLD_STATE if state is None else state
+    target_hour = (state["current_hour"] + hour_offset) % 24
     
     # Load curve modeling (Human behavior simulation)
     if 0 <= target_hour <= 6:
@@ -54,19 +56,22 @@ def forecast_energy_demand(hour_offset: int) -> float:
     else:
         multiplier = 1.0
         
-    demand = WORLD_STATE["grid_load_base"] * multiplier
+    demand = state["grid_load_base"] * multiplier
     # Add stochastic noise
     return round(demand + random.uniform(-5, 5), 2)
 
-def check_generation_capacity() -> Dict[str, float]:
+def check_generation_capacity(state: Dict[str, Any] = None) -> Dict[str, float]:
     """
     Checks current available power from all sources based on environment.
     
+    Args:
+        state: Grid state to read from (defaults to WORLD_STATE).
     Returns:
         dict: Available MW for Solar, Wind, Gas, and current Gas Reserves.
     """
-    hour = WORLD_STATE["current_hour"]
-    weather = WORLD_STATE["weather_condition"]
+    state = WORLD_STATE if state is None else state
+    hour = state["current_hour"]
+    weather = state["weather_condition"]
     
     # Solar Logic: Time and cloud dependent
     if 6 <= hour <= 18:
@@ -82,40 +87,43 @@ def check_generation_capacity() -> Dict[str, float]:
         wind_cap = random.uniform(10, 50)
         
     # Gas Logic: Stable source, limited by current physical reserves
-    gas_cap = min(200.0, WORLD_STATE["gas_reserve_mw"])
+    gas_cap = min(200.0, state["gas_reserve_mw"])
     
     return {
         "solar": round(max(0, solar_cap), 2),
         "wind": round(wind_cap, 2),
         "gas": round(gas_cap, 2),
-        "gas_reserve": round(WORLD_STATE["gas_reserve_mw"], 2) # Crucial for Replanning 
+        "gas_reserve": round(state["gas_reserve_mw"], 2) # Crucial for Replanning 
     }
 
-def dispatch_energy_plan(distribution: Dict[str, float]) -> Dict[str, Any]:
+def dispatch_energy_plan(distribution: Dict[str, float], state: Dict[str, Any] = None) -> Dict[str, Any]:
     """
      Applies the energy distribution plan and returns grid stability metrics.
     
     Args:
         distribution: Dict containing MW per source (solar, wind, gas).
+            May also contain "import", the net MW received from neighbouring grids.
+        state: Grid state to apply the plan to (defaults to WORLD_STATE).
     Returns:
         dict: Execution status, stability metrics, and operational cost.
     """
-    actual_demand = forecast_energy_demand(0)
+    state = WORLD_STATE if state is None else state
+    actual_demand = forecast_energy_demand(0, state)
     total_supply = sum(distribution.values())
     gas_requested = distribution.get("gas", 0)
 
     # Graceful Failure Trigger
-    if gas_requested > WORLD_STATE["gas_reserve_mw"]:
+    if gas_requested > state["gas_reserve_mw"]:
         return {
             "status": "FAILED",
             "error": "Insufficient gas reserves",
             "blackout_risk": "CRITICAL",
-            "remaining_gas" : round(WORLD_STATE["gas_reserve_mw"], 2)
+            "remaining_gas" : round(state["gas_reserve_mw"], 2)
         }
     
     # State Persistence: Update the world
-    WORLD_STATE["gas_reserve_mw"] -= gas_requested
-    WORLD_STATE["current_hour"] = (WORLD_STATE["current_hour"] + 1) % 24
+    state["gas_reserve_mw"] -= gas_requested
+    state["current_hour"] = (state["current_hour"] + 1) % 24
     
     # Cost and Stability Calculation
     total_cost = gas_requested * GAS_COST_PER_MW
@@ -135,5 +143,5 @@ def dispatch_energy_plan(distribution: Dict[str, float]) -> Dict[str, Any]:
         "frequency_deviation": round(freq_dev, 4),
         "blackout_risk": risk,
         "cost": total_cost,
-        "remaining_gas": round(WORLD_STATE["gas_reserve_mw"], 2)
+        "remaining_gas": round(state["gas_reserve_mw"], 2)
     }
\ No newline at end of file